@@ -2,8 +2,8 @@
 """
 Quick UI Test - Verify web interface is working
 """
-import requests
 import json
+from tests._http import JSON_HEADERS, SESSION, dump_json, parse_json
 
 def test_server():
     base_url = "http://localhost:8080"
@@ -13,9 +13,9 @@ def test_server():
     
     # Test 1: Server health
     try:
-        response = requests.get(f"{base_url}/api/status", timeout=5)
+        response = SESSION.get(f"{base_url}/api/status", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print("✅ Server Health:", data.get("status", "unknown"))
         else:
             print("❌ Server Health: Failed")
@@ -25,7 +25,7 @@ def test_server():
     
     # Test 2: Dashboard
     try:
-        response = requests.get(f"{base_url}/", timeout=5)
+        response = SESSION.get(f"{base_url}/", timeout=5)
         if response.status_code == 200:
             content = response.text
             has_ui = 'input' in content and 'button' in content
@@ -37,10 +37,10 @@ def test_server():
         
     # Test 3: API scan
     try:
-        scan_data = {"url": "https://cloudflare.com"}
-        response = requests.post(f"{base_url}/api/scan", json=scan_data, timeout=15)
+        scan_data = dump_json({"url": "https://cloudflare.com"})
+        response = SESSION.post(f"{base_url}/api/scan", data=scan_data, headers=JSON_HEADERS, timeout=15)
         if response.status_code == 200:
-            result = response.json()
+            result = parse_json(response)
             if result.get("success"):
                 detection = result.get("result", {})
                 waf = detection.get("detected_waf")
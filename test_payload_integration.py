@@ -2,8 +2,18 @@
 """
 Test payload-based probing integration
 """
-import requests
+import asyncio
 import json
+from tests._http import JSON_HEADERS, SESSION, dump_json, parse_json
+
+async def _scan_all(base_url, urls):
+    """POST every URL to /api/scan concurrently, keeping results in URL order"""
+    return await asyncio.gather(
+        *(asyncio.to_thread(SESSION.post, f"{base_url}/api/scan", data=dump_json({"url": url}),
+                            headers=JSON_HEADERS, timeout=30)
+          for url in urls),
+        return_exceptions=True,
+    )
 
 def test_payload_integration():
     base_url = "http://localhost:8080"
@@ -13,7 +23,7 @@ def test_payload_integration():
     
     # Test server health first
     try:
-        response = requests.get(f"{base_url}/api/status", timeout=5)
+        response = SESSION.get(f"{base_url}/api/status", timeout=5)
         if response.status_code != 200:
             print("❌ Server not running")
             return False
@@ -28,15 +38,18 @@ def test_payload_integration():
         "https://aws.amazon.com",  # AWS site that might have WAF
     ]
     
-    for url in test_urls:
+    # Scans run concurrently; results are reported in order afterwards
+    responses = asyncio.run(_scan_all(base_url, test_urls))
+    
+    for url, response in zip(test_urls, responses):
         print(f"\n🔍 Testing payload analysis for: {url}")
         
         try:
-            scan_data = {"url": url}
-            response = requests.post(f"{base_url}/api/scan", json=scan_data, timeout=30)
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
-                result = response.json()
+                result = parse_json(response)
                 if result.get("success"):
                     detection = result.get("result", {})
                     evidence_map = detection.get("evidence_map", {})
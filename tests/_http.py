@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the WAF Detector test scripts
+One keep-alive connection pool, sized for the local web server, reused by every test module
+"""
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+SESSION = requests.Session()
+SESSION.headers.update({"Connection": "keep-alive"})
+
+# Retry only covers idempotent requests; scan POSTs are never replayed.
+# The server speaks plain-text HTTP/1.1, so concurrent requests are not multiplexed:
+# each in-flight request holds its own pooled connection, and pool_maxsize must
+# stay above the tests' concurrency (4 parallel tests x up to 4 URLs) to avoid
+# head-of-line waits and discarded connections.
+_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.1))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+def dump_json(payload) -> bytes:
+    """Serialize a request body to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def parse_json(response: requests.Response):
+    """Parse a response body as JSON, using orjson when it is installed"""
+    try:
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return json.loads(response.content)
+    except json.JSONDecodeError as e:
+        # Raise what response.json() would, so RequestException handlers still apply
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e